@@ -741,9 +741,12 @@ def FindPossibleExtrapolationsToRun(TopLevelInputDir) :
     return SubdirectoriesAndDataFiles
 
 def RunExtrapolation(TopLevelInputDir, TopLevelOutputDir, Subdirectory, DataFile, Template) :
-    from os import makedirs, chdir, getcwd, utime, remove
+    from os import makedirs, chdir, getcwd, utime, remove, rename
+    from os import read as os_read
     from os.path import exists
-    from subprocess import call
+    from subprocess import Popen, PIPE, STDOUT
+    from sys import stdout
+    from codecs import getincrementaldecoder
 
     InputDir = '{0}/{1}'.format(TopLevelInputDir, Subdirectory)
     OutputDir = '{0}/{1}'.format(TopLevelOutputDir, Subdirectory)
@@ -751,16 +754,19 @@ def RunExtrapolation(TopLevelInputDir, TopLevelOutputDir, Subdirectory, DataFile
         makedirs(OutputDir)
 
     # If OutputDir/.started_r...h5 doesn't exist, touch it; remove errors and finished reports
-    with file('{0}/.started_{1}'.format(OutputDir,DataFile), 'a') :
+    with open('{0}/.started_{1}'.format(OutputDir,DataFile), 'a') :
         utime('{0}/.started_{1}'.format(OutputDir,DataFile), None)
     if(exists('{0}/.error_{1}'.format(OutputDir,DataFile))) :
         remove('{0}/.error_{1}'.format(OutputDir,DataFile))
     if(exists('{0}/.finished_{1}'.format(OutputDir,DataFile))) :
         remove('{0}/.finished_{1}'.format(OutputDir,DataFile))
 
-    # Copy the template file to OutputDir
-    with open('{0}/Extrapolate_{1}.py'.format(OutputDir,DataFile[:-3]), 'w') as TemplateFile :
+    # Copy the template file to OutputDir, via a temporary file so that
+    # an interrupted write never leaves a partial script to be run
+    ScriptFile = '{0}/Extrapolate_{1}.py'.format(OutputDir,DataFile[:-3])
+    with open(ScriptFile+'.tmp', 'w') as TemplateFile :
         TemplateFile.write(_safe_format(Template, DataFile=DataFile, Subdirectory=Subdirectory))
+    rename(ScriptFile+'.tmp', ScriptFile)
 
     # Try to run the extrapolation
     OriginalDir = getcwd()
@@ -771,7 +777,36 @@ def RunExtrapolation(TopLevelInputDir, TopLevelOutputDir, Subdirectory, DataFile
             print("Couldn't change directory to '{0}'.".format(OutputDir))
             raise
         print("\n\nRunning {1}/Extrapolate_{0}.py\n\n".format(DataFile[:-3], getcwd()))
-        ReturnValue = call("set -o pipefail; python Extrapolate_{0}.py 2>&1 | tee Extrapolate_{0}.log".format(DataFile[:-3]), shell=True)
+        # Run the script, copying its combined output to both stdout and the log file
+        # (echoing is best-effort: if stdout can't take the output, only the log is written)
+        stdout.flush()
+        if hasattr(stdout, 'buffer') :
+            Echo = stdout.buffer.write
+        elif bytes is str :
+            Echo = stdout.write # Python 2 file objects take byte strings
+        else :
+            # Text-only streams (StringIO, redirect_stdout, ipykernel) need decoded text
+            Decoder = getincrementaldecoder('utf-8')('replace')
+            Echo = lambda chunk : stdout.write(Decoder.decode(chunk))
+        with open('Extrapolate_{0}.log'.format(DataFile[:-3]), 'wb') as LogFile :
+            Process = Popen(['python', 'Extrapolate_{0}.py'.format(DataFile[:-3])], stdout=PIPE, stderr=STDOUT)
+            try :
+                # os.read returns whatever is available, so output is forwarded as it arrives
+                for chunk in iter(lambda : os_read(Process.stdout.fileno(), 4096), b'') :
+                    LogFile.write(chunk)
+                    if Echo :
+                        try :
+                            Echo(chunk)
+                            stdout.flush()
+                        except Exception :
+                            Echo = None
+            except :
+                Process.kill()
+                Process.wait()
+                raise
+            finally :
+                Process.stdout.close()
+            ReturnValue = Process.wait()
         if(ReturnValue) :
             print("\n\nRunExtrapolation got an error ({4}) on ['{0}', '{1}', '{2}', '{3}'].\n\n".format(TopLevelInputDir, TopLevelOutputDir, Subdirectory, DataFile, ReturnValue))
             with open('{0}/.error_{1}'.format(OutputDir,DataFile), 'w') : pass
@@ -135,10 +135,10 @@ for key, value in cfs.items() :
 ## Try to determine an automatic version number for this
 try :
     with open(devnull, "w") as fnull :
-        GitRev = check_output('git rev-parse HEAD', shell=True, stderr=fnull)[:-1]
+        GitRev = check_output(['git', 'rev-parse', 'HEAD'], stderr=fnull).rstrip()
         CodeRevision = '"{0}"'.format(GitRev)
         PackageVersion = GitRev[:9]
-except (NameError, CalledProcessError) :
+except (NameError, OSError, CalledProcessError) :
     CodeRevision = '"PaperVersion3"'
     PackageVersion = '3'
 